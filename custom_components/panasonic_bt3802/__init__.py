@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import logging
 
+from homeassistant.const import EVENT_HOMEASSISTANT_STOP
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.discovery import async_load_platform
 
@@ -15,6 +16,11 @@ async def async_setup(hass: HomeAssistant, config: dict) -> bool:
     coordinator = PanasonicBT3802Coordinator(hass)
     hass.data.setdefault(DOMAIN, {})["coordinator"] = coordinator
 
+    # Dedicated keep-alive session is not managed by HA, close it ourselves
+    hass.bus.async_listen_once(
+        EVENT_HOMEASSISTANT_STOP, coordinator.async_close_session
+    )
+
     await coordinator.async_refresh()
 
     _LOGGER.info("Panasonic BT3802 polling started (static IP)")
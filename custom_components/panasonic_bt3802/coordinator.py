@@ -1,12 +1,14 @@
 from __future__ import annotations
 
 import logging
+import random
 from datetime import timedelta
 from typing import Any
 
+import aiohttp
+
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
-from homeassistant.helpers.aiohttp_client import async_get_clientsession
 
 from .const import (
     DOMAIN,
@@ -20,32 +22,61 @@ _LOGGER = logging.getLogger(__name__)
 
 POLL_INTERVAL = timedelta(seconds=60)
 
+# Differential polling: back off only after several consecutive balanced-grid
+# readings (V2H covering the house load) and return to POLL_INTERVAL on the
+# first reading with flow. Kept short so an import starting when the V2H
+# stalls is still seen within ~2 minutes.
+POLL_INTERVAL_IDLE = timedelta(seconds=120)
+IDLE_READINGS_BEFORE_BACKOFF = 3
+ACTIVE_FLOW_KW = 0.05
+
+# +/- jitter so this poll doesn't keep landing on the same loop tick as others
+POLL_JITTER_S = 2.0
 
-def _safe_float(value: str) -> float:
-    try:
-        return float(value.strip())
-    except Exception:
-        return 0.0
+# Keep the socket to the BT3802 open across polls (exceeds every interval
+# above incl. jitter). The BT3802's own server may still close idle sockets
+# sooner, in which case the next poll simply reconnects.
+KEEPALIVE_TIMEOUT = 150
+REQUEST_HEADERS = {"Connection": "keep-alive"}
 
 
-def _parse_bt3802_csv(csv_text: str) -> tuple[float, float]:
+def _parse_bt3802_csv_bytes(raw: bytes) -> tuple[float, float]:
     """
-    Parse Panasonic BT3802 sys_current.csv.
+    Parse Panasonic BT3802 sys_current.csv straight from the raw payload.
 
     Your confirmed format:
     - raw CSV line 3 contains the current values row
     - column 65 = bought (kW), column 66 = sold (kW)
-    """
-    lines = csv_text.splitlines()
-    if len(lines) <= CSV_DATA_LINE_INDEX:
-        raise ValueError(f"CSV too short: {len(lines)} lines")
-
-    row = lines[CSV_DATA_LINE_INDEX].split(",")
-    if len(row) <= max(CSV_COL_BOUGHT, CSV_COL_SOLD):
-        raise ValueError(f"CSV row too short: {len(row)} cols")
 
-    bought = _safe_float(row[CSV_COL_BOUGHT])
-    sold = _safe_float(row[CSV_COL_SOLD])
+    Only the two target fields are sliced out and passed to float() as bytes;
+    nothing is split or decoded.
+    """
+    pos = 0
+    for line in range(CSV_DATA_LINE_INDEX):
+        idx = raw.find(b"\n", pos)
+        if idx == -1:
+            raise ValueError(f"CSV too short: {line} lines")
+        pos = idx + 1
+
+    row_end = raw.find(b"\n", pos)
+    if row_end == -1:
+        row_end = len(raw)
+
+    fields: dict[int, bytes] = {}
+    for col in range(max(CSV_COL_BOUGHT, CSV_COL_SOLD) + 1):
+        end = raw.find(b",", pos, row_end)
+        if end == -1:
+            end = row_end
+        if col in (CSV_COL_BOUGHT, CSV_COL_SOLD):
+            fields[col] = raw[pos:end]
+        if end == row_end and col < max(CSV_COL_BOUGHT, CSV_COL_SOLD):
+            raise ValueError(f"CSV row too short: {col + 1} cols")
+        pos = end + 1
+
+    # Numeric fields are plain ASCII (valid CP932), float() takes them as bytes
+    # and ignores surrounding whitespace. A malformed value raises ValueError.
+    bought = float(fields[CSV_COL_BOUGHT])
+    sold = float(fields[CSV_COL_SOLD])
 
     # Enforce exclusivity
     if bought > 0:
@@ -53,7 +84,7 @@ def _parse_bt3802_csv(csv_text: str) -> tuple[float, float]:
     elif sold > 0:
         bought = 0.0
 
-    return round(bought, 3), round(sold, 3)
+    return bought, sold
 
 
 class PanasonicBT3802Coordinator(DataUpdateCoordinator[dict[str, Any]]):
@@ -66,23 +97,82 @@ class PanasonicBT3802Coordinator(DataUpdateCoordinator[dict[str, Any]]):
             name="Panasonic BT3802 Coordinator",
             update_interval=POLL_INTERVAL,
         )
-        self._session = async_get_clientsession(hass)
+        self._base_interval = POLL_INTERVAL
+        self._idle_readings = 0
+        self._session_closed = False
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        """Return the dedicated keep-alive session, creating it on first use."""
+        if self._session_closed:
+            # Home Assistant is stopping; a new session would never be closed
+            raise ConnectionError("BT3802 session is closed")
+        domain_data = self.hass.data.setdefault(DOMAIN, {})
+        session: aiohttp.ClientSession | None = domain_data.get("session")
+        if session is None or session.closed:
+            session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit_per_host=1,
+                    keepalive_timeout=KEEPALIVE_TIMEOUT,
+                )
+            )
+            domain_data["session"] = session
+        return session
+
+    async def async_close_session(self, *_: Any) -> None:
+        """Close the dedicated session (called on Home Assistant stop)."""
+        self._session_closed = True
+        session: aiohttp.ClientSession | None = self.hass.data.get(DOMAIN, {}).pop(
+            "session", None
+        )
+        if session is not None and not session.closed:
+            await session.close()
 
     async def _async_update_data(self) -> dict[str, Any]:
         try:
-            async with self._session.get(PANASONIC_URL, timeout=10) as resp:
+            session = self._get_session()
+            async with session.get(
+                PANASONIC_URL, headers=REQUEST_HEADERS, timeout=10
+            ) as resp:
                 if resp.status != 200:
                     raise UpdateFailed(f"HTTP {resp.status}")
 
-                raw = await resp.read()
-                # Panasonic CSV is typically CP932/Shift-JIS.
-                text = raw.decode("cp932", errors="ignore")
-
-            bought, sold = _parse_bt3802_csv(text)
+                # Only the first CSV_DATA_LINE_INDEX + 1 lines are needed.
+                # If the body has no newlines readline() returns all of it at
+                # EOF, which the parser handles like a full read.
+                lines: list[bytes] = []
+                for _ in range(CSV_DATA_LINE_INDEX + 1):
+                    line = await resp.content.readline()
+                    if not line:
+                        break
+                    lines.append(line)
+
+                # Drain the rest without buffering it so the keep-alive
+                # connection can be reused for the next poll
+                async for _chunk in resp.content.iter_chunked(4096):
+                    pass
+
+            raw = b"".join(lines)
+
+            bought, sold = _parse_bt3802_csv_bytes(raw)
+            if (bought + sold) > ACTIVE_FLOW_KW:
+                self._idle_readings = 0
+            else:
+                self._idle_readings += 1
+            interval = (
+                POLL_INTERVAL_IDLE
+                if self._idle_readings >= IDLE_READINGS_BEFORE_BACKOFF
+                else self._base_interval
+            )
+            self.update_interval = interval + timedelta(
+                seconds=random.uniform(-POLL_JITTER_S, POLL_JITTER_S)
+            )
             return {
                 "grid_power_bought_kw": bought,
                 "grid_power_sold_kw": sold,
             }
 
         except Exception as err:
+            # Don't sit on the idle interval while the device is unreachable
+            self._idle_readings = 0
+            self.update_interval = self._base_interval
             raise UpdateFailed(f"Error fetching/parsing BT3802 CSV: {err}") from err
@@ -25,6 +25,7 @@ class _BasePanasonicSensor(SensorEntity):
     _attr_native_unit_of_measurement = UnitOfPower.KILO_WATT
     _attr_device_class = SensorDeviceClass.POWER
     _attr_state_class = "measurement"
+    _attr_suggested_display_precision = 3
     _attr_should_poll = False
 
     def __init__(self, coordinator):
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import logging
+from dataclasses import dataclass
 from typing import Final
 
 from homeassistant.config_entries import ConfigEntry
@@ -16,12 +17,23 @@ DOMAIN: Final = "v2h_nichicon"
 PLATFORMS: Final[list[Platform]] = [Platform.SENSOR, Platform.SWITCH]
 
 
+@dataclass(slots=True)
+class V2HRuntimeData:
+    """Per-entry objects shared with the platforms via entry.runtime_data."""
+
+    coordinator: V2HCoordinator
+    client: NichiconV2HClient
+
+
+V2HConfigEntry = ConfigEntry[V2HRuntimeData]
+
+
 async def async_setup(hass: HomeAssistant, config: dict) -> bool:
     """Set up via YAML (unused)."""
     return True
 
 
-async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
+async def async_setup_entry(hass: HomeAssistant, entry: V2HConfigEntry) -> bool:
     """Set up Nichicon V2H from config entry."""
 
     # Default host for now
@@ -31,15 +43,15 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 
     # Create async API client
     client = NichiconV2HClient(host)
+    # Runs on unload and when a failed setup is retried, so the UDP endpoint
+    # opened by the first refresh is never leaked
+    entry.async_on_unload(client.async_close)
 
     # Create DataUpdateCoordinator
     coordinator = V2HCoordinator(hass, client)
 
     # Store coordinator for platforms to access
-    hass.data.setdefault(DOMAIN, {})[entry.entry_id] = {
-        "coordinator": coordinator,
-        "client": client,
-    }
+    entry.runtime_data = V2HRuntimeData(coordinator=coordinator, client=client)
 
     # Start polling
     await coordinator.async_config_entry_first_refresh()
@@ -50,11 +62,6 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     return True
 
 
-async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
+async def async_unload_entry(hass: HomeAssistant, entry: V2HConfigEntry) -> bool:
     """Unload integration."""
-    unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
-
-    if unload_ok:
-        hass.data[DOMAIN].pop(entry.entry_id, None)
-
-    return unload_ok
+    return await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
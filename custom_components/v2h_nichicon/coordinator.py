@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import logging
+import random
 from datetime import timedelta
 
 from homeassistant.helpers.update_coordinator import (
@@ -16,6 +17,9 @@ _LOGGER = logging.getLogger(__name__)
 # Polling every 2 seconds
 POLL_INTERVAL = timedelta(seconds=2)
 
+# +/- jitter so this poll doesn't keep landing on the same loop tick as others
+POLL_JITTER_S = 0.2
+
 
 class V2HCoordinator(DataUpdateCoordinator[V2HStatus]):
     """Coordinator to manage V2H polling."""
@@ -33,6 +37,10 @@ class V2HCoordinator(DataUpdateCoordinator[V2HStatus]):
         """Fetch updated data from the V2H."""
         try:
             status = await self.client.get_realtime_status()
-            return status
         except Exception as err:
             raise UpdateFailed(f"Error updating V2H data: {err}") from err
+
+        self.update_interval = POLL_INTERVAL + timedelta(
+            seconds=random.uniform(-POLL_JITTER_S, POLL_JITTER_S)
+        )
+        return status
@@ -1,12 +1,11 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from enum import Enum
 from datetime import timedelta
 import logging
 
 from homeassistant.core import HomeAssistant
-from homeassistant.util import dt as dt_util
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -16,12 +15,14 @@ class RecoveryStep(str, Enum):
     STEP1_TIMER_TOGGLE = "step1_timer_toggle"
     STEP2_START_DISCHARGE = "step2_start_discharge"
     STEP3_CONNECTOR_RESET = "step3_connector_reset"
+    STEP3_LOCK = "step3_lock"
     STEP4_START_CHARGE = "step4_start_charge"
+    STEP4_STOP = "step4_stop"
     DONE = "done"
     FAILED = "failed"
 
 
-@dataclass
+@dataclass(slots=True)
 class NissanObservedState:
     # Derived from sensors (coordinator data)
     connected: bool
@@ -33,7 +34,7 @@ class NissanObservedState:
     grid_bought_kw: float
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class RecoveryConfig:
     # thresholds / timing
     chg_on_kw: float = 0.2
@@ -54,12 +55,36 @@ class RecoveryConfig:
     # retries
     max_attempts: int = 2
 
+    # Same timings as float seconds, for comparisons against loop.time().
+    # Derived once; the config is frozen so they can't go stale.
+    stuck_after_s: float = field(init=False, repr=False)
+    cooldown_after_success_s: float = field(init=False, repr=False)
+    cooldown_after_failure_s: float = field(init=False, repr=False)
+    wait_after_step1_s: float = field(init=False, repr=False)
+    wait_after_step2_s: float = field(init=False, repr=False)
+    wait_between_unlock_lock_s: float = field(init=False, repr=False)
+    wait_after_step3_s: float = field(init=False, repr=False)
+    step4_charge_duration_s: float = field(init=False, repr=False)
+    wait_after_step4_stop_s: float = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        # frozen=True: derived fields must bypass the generated __setattr__
+        object.__setattr__(self, "stuck_after_s", self.stuck_after.total_seconds())
+        object.__setattr__(self, "cooldown_after_success_s", self.cooldown_after_success.total_seconds())
+        object.__setattr__(self, "cooldown_after_failure_s", self.cooldown_after_failure.total_seconds())
+        object.__setattr__(self, "wait_after_step1_s", self.wait_after_step1.total_seconds())
+        object.__setattr__(self, "wait_after_step2_s", self.wait_after_step2.total_seconds())
+        object.__setattr__(self, "wait_between_unlock_lock_s", self.wait_between_unlock_lock.total_seconds())
+        object.__setattr__(self, "wait_after_step3_s", self.wait_after_step3.total_seconds())
+        object.__setattr__(self, "step4_charge_duration_s", self.step4_charge_duration.total_seconds())
+        object.__setattr__(self, "wait_after_step4_stop_s", self.wait_after_step4_stop.total_seconds())
+
 
 class NissanRecoveryController:
     """
     Stateless-internals-recovery controller.
     - Called periodically from coordinator update loop.
-    - Never blocks (no sleeps). Uses timestamps.
+    - Never blocks (no sleeps). Uses monotonic timestamps (loop.time()).
     """
 
     def __init__(
@@ -87,9 +112,10 @@ class NissanRecoveryController:
 
         self._step: RecoveryStep = RecoveryStep.IDLE
         self._attempt: int = 0
-        self._since_idle_wrong: dt_util.dt.datetime | None = None
-        self._next_action_at: dt_util.dt.datetime | None = None
-        self._cooldown_until: dt_util.dt.datetime | None = None
+        # Monotonic timestamps from hass.loop.time()
+        self._since_idle_wrong: float | None = None
+        self._next_action_at: float | None = None
+        self._cooldown_until: float | None = None
 
     # -----------------
     # Public interface
@@ -104,11 +130,11 @@ class NissanRecoveryController:
         return self._attempt
 
     def in_cooldown(self) -> bool:
-        return self._cooldown_until is not None and dt_util.utcnow() < self._cooldown_until
+        return self._cooldown_until is not None and self.hass.loop.time() < self._cooldown_until
 
     async def tick(self, obs: NissanObservedState) -> None:
         """Run one supervisor tick."""
-        now = dt_util.utcnow()
+        now = self.hass.loop.time()
 
         # Basic eligibility gates
         if not obs.connected:
@@ -125,6 +151,10 @@ class NissanRecoveryController:
         if self.in_cooldown():
             return
 
+        # Cooldown over: a finished attempt cycle starts again from idle
+        if self._step in (RecoveryStep.DONE, RecoveryStep.FAILED):
+            self._reset("cooldown finished")
+
         active = self._is_active(obs)
         should_be_active = self._should_be_active(obs)
 
@@ -139,7 +169,7 @@ class NissanRecoveryController:
             should_be_active
             and not active
             and self._since_idle_wrong is not None
-            and (now - self._since_idle_wrong) >= self.cfg.stuck_after
+            and (now - self._since_idle_wrong) >= self.cfg.stuck_after_s
         )
 
         # If not stuck and not recovering, nothing to do
@@ -166,7 +196,7 @@ class NissanRecoveryController:
     # Step machine
     # -----------------
 
-    async def _run_steps(self, obs: NissanObservedState, now) -> None:
+    async def _run_steps(self, obs: NissanObservedState, now: float) -> None:
         # Wait gate
         if self._next_action_at is not None and now < self._next_action_at:
             return
@@ -181,37 +211,37 @@ class NissanRecoveryController:
         if self._step == RecoveryStep.STEP1_TIMER_TOGGLE:
             # Best-effort: toggle if exposed; ignore failures
             await self._toggle_optional_timers()
-            self._next_action_at = now + self.cfg.wait_after_step1
+            self._next_action_at = now + self.cfg.wait_after_step1_s
             self._step = RecoveryStep.STEP2_START_DISCHARGE
             return
 
         if self._step == RecoveryStep.STEP2_START_DISCHARGE:
             await self._press_button("start_discharge")
-            self._next_action_at = now + self.cfg.wait_after_step2
+            self._next_action_at = now + self.cfg.wait_after_step2_s
             self._step = RecoveryStep.STEP3_CONNECTOR_RESET
             return
 
         if self._step == RecoveryStep.STEP3_CONNECTOR_RESET:
             await self._press_button("unlock_connector")
-            self._next_action_at = now + self.cfg.wait_between_unlock_lock
-            self._step = RecoveryStep.STEP3_CONNECTOR_RESET + "_LOCK"  # sentinel
+            self._next_action_at = now + self.cfg.wait_between_unlock_lock_s
+            self._step = RecoveryStep.STEP3_LOCK
             return
 
-        if self._step == (RecoveryStep.STEP3_CONNECTOR_RESET + "_LOCK"):  # type: ignore[operator]
+        if self._step == RecoveryStep.STEP3_LOCK:
             await self._press_button("lock_connector")
-            self._next_action_at = now + self.cfg.wait_after_step3
+            self._next_action_at = now + self.cfg.wait_after_step3_s
             self._step = RecoveryStep.STEP4_START_CHARGE
             return
 
         if self._step == RecoveryStep.STEP4_START_CHARGE:
             await self._press_button("start_charge")
-            self._next_action_at = now + self.cfg.step4_charge_duration
-            self._step = RecoveryStep.STEP4_START_CHARGE + "_STOP"  # sentinel
+            self._next_action_at = now + self.cfg.step4_charge_duration_s
+            self._step = RecoveryStep.STEP4_STOP
             return
 
-        if self._step == (RecoveryStep.STEP4_START_CHARGE + "_STOP"):  # type: ignore[operator]
+        if self._step == RecoveryStep.STEP4_STOP:
             await self._press_button("stop")
-            self._next_action_at = now + self.cfg.wait_after_step4_stop
+            self._next_action_at = now + self.cfg.wait_after_step4_stop_s
             # After step4, loop back: try step1 again if supported, else step2
             self._step = RecoveryStep.STEP1_TIMER_TOGGLE if self.supports_timer_toggles else RecoveryStep.STEP2_START_DISCHARGE
             return
@@ -248,4 +278,65 @@ class NissanRecoveryController:
             blocking=False,
         )
 
-    async def _toggle_optional_t_
+    async def _toggle_optional_timers(self) -> None:
+        """
+        Power-cycle the user's Nichicon timer switches (step 1).
+
+        New behaviour (the original helper was lost to truncation): for each
+        switch mapped under "charge_timer" / "discharge_timer" in `services`,
+        call switch.turn_off, wait for it, then switch.turn_on. turn_on is
+        always attempted once turn_off succeeded, so a timer is never left
+        disabled silently; a failed turn_on is logged as an error.
+        """
+        for logical in ("charge_timer", "discharge_timer"):
+            entity_id = self.services.get(logical)
+            if not entity_id:
+                continue
+
+            try:
+                await self.hass.services.async_call(
+                    "switch",
+                    "turn_off",
+                    {"entity_id": entity_id},
+                    blocking=True,
+                )
+            except Exception as err:
+                # Timer untouched; step 1 is best-effort
+                _LOGGER.warning("Recovery: turning off %s failed: %s", entity_id, err)
+                continue
+
+            try:
+                await self.hass.services.async_call(
+                    "switch",
+                    "turn_on",
+                    {"entity_id": entity_id},
+                    blocking=True,
+                )
+            except Exception as err:
+                _LOGGER.error(
+                    "Recovery: turning %s back on failed, timer left OFF: %s",
+                    entity_id,
+                    err,
+                )
+
+    # -----------------
+    # State helpers
+    # -----------------
+
+    def _enter_cooldown(self, *, failure: bool) -> None:
+        cooldown_s = (
+            self.cfg.cooldown_after_failure_s
+            if failure
+            else self.cfg.cooldown_after_success_s
+        )
+        self._cooldown_until = self.hass.loop.time() + cooldown_s
+        self._since_idle_wrong = None
+        self._next_action_at = None
+
+    def _reset(self, reason: str) -> None:
+        if self._step != RecoveryStep.IDLE:
+            _LOGGER.debug("Recovery: reset (%s)", reason)
+        self._step = RecoveryStep.IDLE
+        self._attempt = 0
+        self._since_idle_wrong = None
+        self._next_action_at = None
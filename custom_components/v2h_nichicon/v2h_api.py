@@ -3,9 +3,9 @@ from __future__ import annotations
 import asyncio
 import logging
 import socket
+import struct
 from dataclasses import dataclass
-from datetime import datetime
-from typing import List, Tuple
+from typing import Any, Callable, Sequence, Tuple
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -17,26 +17,117 @@ EHD2 = 0x81
 ESV_GET = 0x62      # Get
 ESV_GET_RES = 0x72  # Get response
 
+# Frame layout: EHD1 EHD2 TID(2) SEOJ(3) DEOJ(3) ESV OPC, then OPC x (EPC PDC EDT)
+OPC_OFFSET = 11
+
+# Unsigned 32-bit big-endian EDT (e.g. instantaneous power in W)
+_PWR_STRUCT = struct.Struct(">I")
+
+
+def _parse_power_kw(data: bytes, offset: int, pdc: int) -> float:
+    """Decode a power EDT in W and return kW."""
+    if pdc == 4:
+        value = _PWR_STRUCT.unpack_from(data, offset)[0]
+    else:
+        value = int.from_bytes(data[offset : offset + pdc], "big")
+    return value / 1000.0
+
+
+def _parse_percent(data: bytes, offset: int, pdc: int) -> int:
+    """Decode a 1-byte percentage EDT."""
+    return data[offset]
+
+
+def _parse_vehicle_connected(data: bytes, offset: int, pdc: int) -> bool | None:
+    """Decode vehicle connection status (0x30 = not connected, 0xFF = unknown)."""
+    status = data[offset]
+    if status == 0xFF:
+        return None
+    return status != 0x30
+
+
+# EPC -> (V2HStatus field, parser(data, edt_offset, pdc))
+_EPC_PARSERS: dict[int, Tuple[str, Callable[[bytes, int, int], Any]]] = {
+    0xD3: ("charging_power_kw", _parse_power_kw),     # Real-time charging power
+    0xD4: ("discharging_power_kw", _parse_power_kw),  # Real-time discharging power
+    0xE4: ("soc", _parse_percent),                    # Remaining capacity 3 (%)
+    0xC7: ("connected", _parse_vehicle_connected),    # Vehicle connection status
+}
+
+# EPCs requested together in one GET on every real-time poll:
+# D3 (charge), D4 (discharge), E4 (SoC %), C7 (vehicle connection status)
+REALTIME_EPCS: Tuple[int, ...] = (0xD3, 0xD4, 0xE4, 0xC7)
+
 # Default ECHONET UDP port
 DEFAULT_ECHONET_PORT = 3610
 
+# UDP loss on Wi-Fi is common: retry a GET before giving up, pausing between tries
+RETRY_BACKOFF_S: Tuple[float, ...] = (0.05, 0.2)
+
+
+class _EchonetProtocol(asyncio.DatagramProtocol):
+    """Datagram protocol routing ECHONET Lite responses to waiters by TID.
 
-@dataclass
+    Only datagrams from `remote` (the V2H unit's resolved address) are accepted.
+    """
+
+    def __init__(self, remote: Tuple[str, int]) -> None:
+        self._remote = remote
+        self._pending: dict[int, asyncio.Future[bytes]] = {}
+
+    def expect(self, tid: int, fut: asyncio.Future[bytes]) -> None:
+        """Register a future to be resolved by the response carrying `tid`."""
+        self._pending[tid] = fut
+
+    def discard(self, tid: int) -> None:
+        """Forget a waiter (e.g. after it timed out)."""
+        self._pending.pop(tid, None)
+
+    def datagram_received(self, data: bytes, addr: Tuple[str, int]) -> None:
+        if addr[:2] != self._remote:
+            _LOGGER.debug("Ignoring datagram from unexpected sender %s", addr)
+            return
+        if len(data) < 4 or data[0] != EHD1 or data[1] != EHD2:
+            _LOGGER.debug("Ignoring non-ECHONET datagram from %s", addr)
+            return
+
+        tid = (data[2] << 8) | data[3]
+        fut = self._pending.pop(tid, None)
+        if fut is None or fut.done():
+            _LOGGER.debug("Ignoring unexpected ECHONET response TID %s", tid)
+            return
+        fut.set_result(data)
+
+    def error_received(self, exc: Exception) -> None:
+        self._fail_pending(exc)
+
+    def connection_lost(self, exc: Exception | None) -> None:
+        self._fail_pending(exc or ConnectionError("ECHONET endpoint closed"))
+
+    def _fail_pending(self, exc: Exception) -> None:
+        pending, self._pending = self._pending, {}
+        for fut in pending.values():
+            if not fut.done():
+                fut.set_exception(exc)
+
+
+@dataclass(slots=True)
 class V2HStatus:
     """Basic snapshot of V2H real-time status."""
 
     charging_power_kw: float | None = None
     discharging_power_kw: float | None = None
+    soc: int | None = None           # vehicle battery state of charge (%)
+    connected: bool | None = None    # vehicle plugged in
     mode: str | None = None          # "charging" / "discharging" / "idle" / None
-    raw_hex: str | None = None       # raw response payload
-    updated_at: datetime | None = None
+    raw_hex: str | None = None       # raw response payload (DEBUG logging only)
 
 
 class NichiconV2HClient:
     """Low-level ECHONET Lite client for Nichicon V2H.
 
     This class handles:
-      - UDP send/receive
+      - UDP send/receive (persistent asyncio datagram endpoint)
       - ECHONET frame construction
       - Basic response decoding placeholder
 
@@ -47,7 +138,7 @@ class NichiconV2HClient:
         self,
         host: str,
         port: int = DEFAULT_ECHONET_PORT,
-        timeout: float = 3.0,
+        timeout: float = 1.0,
         loop: asyncio.AbstractEventLoop | None = None,
     ) -> None:
         self._host = host
@@ -56,11 +147,25 @@ class NichiconV2HClient:
         self._loop = loop or asyncio.get_event_loop()
         self._tid = 1  # transaction ID
 
+        # Lazily created on first exchange, see _ensure_endpoint()
+        self._transport: asyncio.DatagramTransport | None = None
+        self._protocol: _EchonetProtocol | None = None
+        self._remote: Tuple[str, int] | None = None
+        self._closed = False
+
+        # One exchange in flight at a time; a slow reply must not pile up polls
+        self._sem = asyncio.Semaphore(1)
+
         # These are the Echonet object codes for the V2H unit.
         # From V2H_debug.py: SEOJ=0EF001, DEOJ=027E01
         self._seoj = (0x0E, 0xF0, 0x01)  # Controller object
         self._deoj = (0x02, 0x7E, 0x01)  # Nichicon V2H object
 
+        # Real-time GET frame only differs by TID; prebuild the rest once
+        self._default_epcs = REALTIME_EPCS
+        self._frame_prefix = bytes((EHD1, EHD2))
+        self._frame_suffix = self._build_frame_body(self._default_epcs)
+
     # -------------------------------------------------------------------------
     # Internal helpers
     # -------------------------------------------------------------------------
@@ -70,55 +175,114 @@ class NichiconV2HClient:
         self._tid = (self._tid + 1) & 0xFFFF
         return (self._tid >> 8) & 0xFF, self._tid & 0xFF
 
-    def _build_get_frame(self, epcs: List[int]) -> bytes:
-        """Build a simple ECHONET Lite GET frame for given EPCs."""
-        tid_hi, tid_lo = self._next_tid()
-
-        props = bytearray()
+    def _build_frame_body(self, epcs: Sequence[int]) -> bytes:
+        """Build the part of a GET frame following the TID."""
+        frame = bytearray([*self._seoj, *self._deoj, ESV_GET, len(epcs)])
         for epc in epcs:
             # Each GET property: EPC, PDC=0 (no data)
-            props.extend([epc, 0x00])
-
-        opc = len(epcs)
-
-        frame = bytearray(
-            [
-                EHD1,
-                EHD2,
-                tid_hi,
-                tid_lo,
-                *self._seoj,
-                *self._deoj,
-                ESV_GET,
-                opc,
-            ]
-        )
-        frame.extend(props)
+            frame.extend((epc, 0x00))
         return bytes(frame)
 
-    async def _send_and_recv(self, payload: bytes) -> bytes:
-        """Send a UDP packet and await a single response."""
-        _LOGGER.debug("Sending ECHONET frame: %s", payload.hex())
-        loop = self._loop
-
-        def _exchange() -> bytes:
-            with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as sock:
-                sock.settimeout(self._timeout)
-                sock.sendto(payload, (self._host, self._port))
-                data, _addr = sock.recvfrom(1024)
-                return data
+    def _build_get_frame(self, epcs: Sequence[int]) -> bytes:
+        """Build a simple ECHONET Lite GET frame for given EPCs."""
+        tid_hi, tid_lo = self._next_tid()
 
+        if tuple(epcs) == self._default_epcs:
+            suffix = self._frame_suffix
+        else:
+            suffix = self._build_frame_body(epcs)
+
+        return self._frame_prefix + bytes((tid_hi, tid_lo)) + suffix
+
+    async def _resolve_remote(self) -> Tuple[str, int]:
+        """Resolve the V2H host once so replies can be matched by sender."""
+        if self._remote is None:
+            infos = await self._loop.getaddrinfo(
+                self._host, self._port, family=socket.AF_INET, type=socket.SOCK_DGRAM
+            )
+            host, port = infos[0][4][:2]
+            self._remote = (host, port)
+        return self._remote
+
+    async def _ensure_endpoint(self) -> Tuple[asyncio.DatagramTransport, _EchonetProtocol]:
+        """Return the UDP endpoint, creating it on first use."""
+        if self._closed:
+            raise ConnectionError("V2H client is closed")
+        if self._transport is None or self._transport.is_closing():
+            remote = await self._resolve_remote()
+            transport, protocol = await self._loop.create_datagram_endpoint(
+                lambda: _EchonetProtocol(remote), local_addr=("0.0.0.0", 0)
+            )
+            if self._closed:
+                # Closed while the endpoint was being created
+                transport.close()
+                raise ConnectionError("V2H client is closed")
+            self._transport = transport
+            self._protocol = protocol
+        assert self._protocol is not None
+        return self._transport, self._protocol
+
+    async def _exchange_once(self, payload: bytes, tid: int) -> bytes:
+        """Send one UDP packet and await the response matching `tid`."""
+        transport, protocol = await self._ensure_endpoint()
+        remote = await self._resolve_remote()
+        fut: asyncio.Future[bytes] = self._loop.create_future()
+        protocol.expect(tid, fut)
         try:
-            data: bytes = await loop.run_in_executor(None, _exchange)
+            transport.sendto(payload, remote)
+            data = await asyncio.wait_for(fut, self._timeout)
+        finally:
+            protocol.discard(tid)
+
+        if _LOGGER.isEnabledFor(logging.DEBUG):
             _LOGGER.debug("Received ECHONET frame: %s", data.hex())
-            return data
-        except socket.timeout:
+        return data
+
+    async def _send_and_recv(self, payload: bytes) -> bytes:
+        """Send a UDP packet and await the response, retrying with backoff."""
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug("Sending ECHONET frame: %s", payload.hex())
+        tid = (payload[2] << 8) | payload[3]
+
+        attempts = len(RETRY_BACKOFF_S) + 1
+        for attempt, delay in enumerate(RETRY_BACKOFF_S, start=1):
+            try:
+                return await self._exchange_once(payload, tid)
+            except asyncio.TimeoutError:
+                reason = "timeout"
+            except OSError as err:
+                if self._closed:
+                    raise
+                reason = repr(err)
+            _LOGGER.debug(
+                "V2H %s attempt %s/%s failed (%s), retrying",
+                self._host,
+                attempt,
+                attempts,
+                reason,
+            )
+            await asyncio.sleep(delay)
+
+        # Last attempt: failures propagate to the coordinator
+        try:
+            return await self._exchange_once(payload, tid)
+        except asyncio.TimeoutError as err:
             _LOGGER.warning("Timeout talking to V2H %s", self._host)
-            raise
+            raise asyncio.TimeoutError(
+                f"No response from V2H {self._host} after {attempts} attempts"
+            ) from err
         except OSError as err:
             _LOGGER.error("Socket error talking to V2H %s: %s", self._host, err)
             raise
 
+    async def async_close(self) -> None:
+        """Close the UDP endpoint; the client can't be used afterwards."""
+        self._closed = True
+        if self._transport is not None:
+            self._transport.close()
+        self._transport = None
+        self._protocol = None
+
     # -------------------------------------------------------------------------
     # Public API
     # -------------------------------------------------------------------------
@@ -131,11 +295,10 @@ class NichiconV2HClient:
         """
 
         # TODO: Replace EPCs with the correct ones from your working script.
-        # Ask for EPC D3 (charge) and D4 (discharge), just like V2H_debug.py
-        epcs = [0xD3, 0xD4]
-
-        frame = self._build_get_frame(epcs)
-        resp = await self._send_and_recv(frame)
+        # D3/D4 as in V2H_debug.py, plus SoC and connection in the same frame
+        async with self._sem:
+            frame = self._build_get_frame(self._default_epcs)
+            resp = await self._send_and_recv(frame)
 
         status = self._parse_realtime_response(resp)
         return status
@@ -148,35 +311,48 @@ class NichiconV2HClient:
         This mirrors the logic used in V2H_debug.py:
           - EPC 0xD3: real-time charging power (scaled by 1/1000)
           - EPC 0xD4: real-time discharging power (scaled by 1/1000)
+
+        Properties are decoded through _EPC_PARSERS; unknown EPCs are skipped.
         """
 
-        response_hex = data.hex()
-        _LOGGER.debug("V2H response hex: %s", response_hex)
+        response_hex: str | None = None
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            response_hex = data.hex()
+            _LOGGER.debug("V2H response hex: %s", response_hex)
 
-        charging_kw: float | None = None
-        discharging_kw: float | None = None
+        values: dict[str, Any] = {}
 
-        # Parse EPC 0xD3 (Real-Time Charging Power)
-        if "d3" in response_hex:
-            idx = response_hex.index("d3")
-            try:
-                pdc = int(response_hex[idx + 2 : idx + 4], 16)
-                edt_hex = response_hex[idx + 4 : idx + 4 + pdc * 2]
-                charging_kw = int(edt_hex, 16) / 1000.0
-                _LOGGER.debug("Parsed charging power: %s kW", charging_kw)
-            except Exception as err:
-                _LOGGER.warning("Failed to parse charging power from %s: %s", response_hex, err)
-
-        # Parse EPC 0xD4 (Real-Time Discharging Power)
-        if "d4" in response_hex:
-            idx = response_hex.index("d4")
-            try:
-                pdc = int(response_hex[idx + 2 : idx + 4], 16)
-                edt_hex = response_hex[idx + 4 : idx + 4 + pdc * 2]
-                discharging_kw = int(edt_hex, 16) / 1000.0
-                _LOGGER.debug("Parsed discharging power: %s kW", discharging_kw)
-            except Exception as err:
-                _LOGGER.warning("Failed to parse discharging power from %s: %s", response_hex, err)
+        if len(data) <= OPC_OFFSET:
+            _LOGGER.warning("Short ECHONET response from V2H: %s", data.hex())
+            opc = 0
+        else:
+            opc = data[OPC_OFFSET]
+
+        p = OPC_OFFSET + 1
+        for _ in range(opc):
+            if p + 2 > len(data):
+                _LOGGER.warning("Truncated ECHONET response from V2H: %s", data.hex())
+                break
+            epc = data[p]
+            pdc = data[p + 1]
+            edt_at = p + 2
+            p = edt_at + pdc
+            if p > len(data):
+                _LOGGER.warning("Truncated ECHONET property %02x: %s", epc, data.hex())
+                break
+            if pdc == 0:
+                # Property not available (Get_SNA)
+                continue
+
+            parser = _EPC_PARSERS.get(epc)
+            if parser is None:
+                continue
+            name, parse = parser
+            values[name] = parse(data, edt_at, pdc)
+            _LOGGER.debug("Parsed %s: %s", name, values[name])
+
+        charging_kw = values.get("charging_power_kw")
+        discharging_kw = values.get("discharging_power_kw")
 
         mode: str | None = None
         if charging_kw is not None and charging_kw > 0:
@@ -187,9 +363,7 @@ class NichiconV2HClient:
             mode = "idle"
 
         return V2HStatus(
-            charging_power_kw=charging_kw,
-            discharging_power_kw=discharging_kw,
+            **values,
             mode=mode,
             raw_hex=response_hex,
-            updated_at=datetime.utcnow(),
         )